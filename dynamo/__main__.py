@@ -52,12 +52,8 @@ def _documentation_scripts(manager: IDocsManager, gateway: INodeGateway) -> Iter
 
 def _documentation_get_old(manager: IDocsManager, gateway: INodeGateway, doc_files: Iterable[IDocsFile]) -> Iterable[Path]:
     all_doc_files = gateway.documentations([manager.script_doc_path, manager.package_doc_path])
-    for doc_file in doc_files:
-        doc_path = doc_file.doc_path
-        if doc_path not in all_doc_files:
-            continue
-        all_doc_files.remove(doc_path)
-    return all_doc_files
+    current_paths = {doc_file.doc_path for doc_file in doc_files}
+    return [path for path in all_doc_files if path not in current_paths]
 
 
 def _documentation_remove(manager: IDocsManager, gateway: INodeGateway, doc_files: Iterable[IDocsFile]) -> None:
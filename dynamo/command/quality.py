@@ -1,11 +1,21 @@
 from dataclasses import fields
-from typing import Any, Dict, Iterable, List, Protocol
+from typing import Any, Dict, Iterable, List, Protocol, Tuple
 from uuid import uuid4
 
 from dynamo.models.files import AFileBaseModel, Script
 from dynamo.models.nodes import ABaseModel
 from dynamo.utils.checks import is_blank
 
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _field_names(model: Any) -> Tuple[str, ...]:
+    names = _FIELD_NAMES.get(type(model))
+    if names is None:
+        names = tuple(field.name for field in fields(model))
+        _FIELD_NAMES[type(model)] = names
+    return names
+
 
 class Command(Protocol):
 
@@ -45,11 +55,11 @@ class ChangeNoValueCommand(Command):
             self.change_no_value_if_base_model(model)
 
     def change_no_value(self, model: ABaseModel):
-        for field in fields(model):
-            value = getattr(model, field.name)
+        for name in _field_names(model):
+            value = getattr(model, name)
             self.change_no_value_if_base_model(value)
-            self.change_no_value_if_str(model, field.name, value)
-            self.change_no_value_if_list(model, field.name, value)
+            self.change_no_value_if_str(model, name, value)
+            self.change_no_value_if_list(model, name, value)
 
     def execute(self):
         for model in self.models:
@@ -79,9 +89,7 @@ class ChangeUuidCommand(Command):
     def _uuid_dict(self) -> Dict[str, List[Script]]:
         uuid_dict = {}
         for script in self.scripts:
-            if script.uuid not in uuid_dict:
-                uuid_dict[script.uuid] = []
-            uuid_dict[script.uuid].append(script)
+            uuid_dict.setdefault(script.uuid, []).append(script)
         return uuid_dict
 
     def execute(self):
@@ -73,7 +73,4 @@ def _custom_content(file_docs: DocsNodeRepository[CustomFileNode]) -> List[IDocC
 
 def get_docs(file: IModelDocs[CustomFileNode]):
     file_docs = DocsNodeRepository(file, factory=DocsNodeFactory())
-    lines = []
-    for content in _custom_content(file_docs):
-        lines.extend(content.content(1))
-    file.write(lines)
+    file.write(content.docs_lines(_custom_content(file_docs)))
@@ -1,6 +1,6 @@
 from abc import abstractmethod
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from dynamo.docs.docs import IDocsFile, IDocsManager, IModelDocs, TModel
 from dynamo.models.files import CustomFileNode, Package, Script
@@ -64,7 +64,8 @@ class AModelDocFile(ADocFile, IModelDocs[TModel]):
     def src_path(self) -> Path:
         return self.model.path
 
-    def write(self, lines: List[str]):
+    def write(self, lines: Iterable[str]):
+        lines = list(lines)
         handler = self.manager.exporter.file_handler
         paths.create_directory_unless_exist(self.doc_path)
         handler.write(self.doc_path, lines)
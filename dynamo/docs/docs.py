@@ -1,5 +1,6 @@
 from pathlib import Path
-from typing import Any, List, Optional, Protocol, Tuple, TypeVar
+from typing import (Any, Iterable, List, Optional, Protocol, Sequence, Tuple,
+                    TypeVar)
 
 from dynamo.io.file import IoHandler
 from dynamo.models.model import ICustomNode, IFileModel
@@ -31,13 +32,14 @@ TModel = TypeVar('TModel', bound=IFileModel)
 class IModelDocs(IDocsFile, Protocol[TModel]):
     model: TModel
 
-    def write(self, lines: List[str]):
+    def write(self, lines: Iterable[str]):
         ...
 
 
 class IExporter(Protocol):
     file_handler: IoHandler
     value_handler: IValueHandler
+    empty_line_value: str
 
     def empty_line(self, amount: int = 1) -> List[str]:
         ...
@@ -69,7 +71,11 @@ class IExporter(Protocol):
     def as_file_link_list(self, values: List[Tuple[IDocsFile, IDocsFile]]) -> List[str]:
         ...
 
-    def as_table(self, heading: Optional[List[str]], lines: List[List[Any]]) -> List[str]:
+    def as_table(self, heading: Optional[Sequence[str]], lines: List[List[Any]]) -> List[str]:
+        ...
+
+    def add_table(self, lines: List[str], heading: Optional[Sequence[str]],
+                  rows: List[List[Any]]) -> None:
         ...
 
     def table_ranges(self, lines: List[str]) -> List[Tuple[int, int]]:
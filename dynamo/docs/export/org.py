@@ -1,4 +1,4 @@
-from typing import Any, Iterable, List, Optional, Tuple
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
 
 from dynamo.docs.docs import IDocsFile, IExporter
 from dynamo.io.file import OrgHandler
@@ -42,7 +42,7 @@ class OrgTableCreator:
     separator = '|'
     horizontal_separator = '+'
 
-    def __init__(self, headings: List[str], rows: List[List[Any]]) -> None:
+    def __init__(self, headings: Optional[Sequence[str]], rows: List[List[Any]]) -> None:
         self.headings = headings
         self.rows = rows
         self.column_size = self._column_sizes()
@@ -65,9 +65,10 @@ class OrgTableCreator:
         if self.headings is not None:
             for idx, heading in enumerate(self.headings):
                 sizes[idx] = max(sizes[idx], len(heading))
+        cell_without_link = self._cell_without_link
         for row in self.rows:
             for idx, cell in enumerate(row):
-                cell_value = self._cell_without_link(cell)
+                cell_value = cell_without_link(cell)
                 sizes[idx] = max(sizes[idx], len(cell_value))
         return sizes
 
@@ -81,32 +82,35 @@ class OrgTableCreator:
     def _get_row(self, value: str) -> str:
         return f'{self.separator}{value}{self.separator}'
 
-    def _create_row(self, values: List[Any]) -> str:
-        row_values = [self._get_cell(value, idx) for idx, value in enumerate(values)]
-        row = self.separator.join(row_values)
+    def _create_row(self, values: Sequence[Any]) -> str:
+        get_cell = self._get_cell
+        row = self.separator.join(
+            [get_cell(value, idx) for idx, value in enumerate(values)]
+        )
         return self._get_row(row)
 
-    def _create_horizontal_line(self) -> str:
-        columns = []
-        for idx, heading in enumerate(self.headings):
-            heading_value = self._get_cell(heading, idx)
-            column = '-' * len(heading_value)
-            columns.append(column)
-        horizontal_line = self.horizontal_separator.join(columns)
+    def _create_horizontal_line(self, headings: Sequence[str]) -> str:
+        horizontal_line = self.horizontal_separator.join(
+            ['-' * len(self._get_cell(heading, idx)) for idx, heading in enumerate(headings)]
+        )
         return self._get_row(horizontal_line)
 
+    def write(self, lines: List[str]) -> None:
+        if self.headings is not None and len(self.headings) > 0:
+            lines.append(self._create_row(self.headings))
+            lines.append(self._create_horizontal_line(self.headings))
+        create_row = self._create_row
+        lines.extend([create_row(row) for row in self.rows])
+
     def create(self) -> List[str]:
         rows = []
-        if self.headings is not None and len(self.headings) > 0:
-            rows.append(self._create_row(self.headings))
-            rows.append(self._create_horizontal_line())
-        for row in self.rows:
-            rows.append(self._create_row(row))
+        self.write(rows)
         return rows
 
 
 class OrgExporter(IExporter):
     heading_prefix = "*"
+    empty_line_value = ''
 
     def __init__(self, file_handler: OrgHandler, value_handler: IValueHandler,
                  link_handler: OrgLinkCreator) -> None:
@@ -129,7 +133,7 @@ class OrgExporter(IExporter):
         ]
 
     def empty_line(self, amount: int = 1) -> List[str]:
-        return self.value_handler.empty_line(amount)
+        return [self.empty_line_value] * amount
 
     def title(self, file: IDocsFile):
         return [self._get_preamble("Title", file.display_name)]
@@ -173,8 +177,9 @@ class OrgExporter(IExporter):
 
     def _file_link_list(self, values: Iterable[Tuple[IDocsFile, IDocsFile]]) -> List[str]:
         file_links = []
+        file_link = self.file_link
         for value in values:
-            link = self.file_link(*value)
+            link = file_link(*value)
             file_links.append(link)
         return file_links
 
@@ -182,10 +187,15 @@ class OrgExporter(IExporter):
         file_links = self._file_link_list(values)
         return self.as_list(file_links)
 
-    def as_table(self, heading: List[str], lines: List[List[Any]]) -> List[str]:
+    def as_table(self, heading: Optional[Sequence[str]], lines: List[List[Any]]) -> List[str]:
         creator = OrgTableCreator(heading, lines)
         return creator.create()
 
+    def add_table(self, lines: List[str], heading: Optional[Sequence[str]],
+                  rows: List[List[Any]]) -> None:
+        creator = OrgTableCreator(heading, rows)
+        creator.write(lines)
+
     def _table_end(self, start_index: int, lines: List[str]) -> int:
         for idx in range(start_index, len(lines)):
             if lines[idx].startswith(OrgTableCreator.separator):
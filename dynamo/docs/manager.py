@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from dynamo.docs.doc_models import CustomNodeDocFile
 from dynamo.docs.docs import IDocsFile, IDocsManager, IExporter
@@ -23,6 +23,7 @@ class DynamoDocManager(IDocsManager):
         self._doc_path = doc_path
         self.exporter = exporter
         self._manager = manager
+        self._doc_files: Dict[int, IDocsFile] = {}
 
     @property
     def doc_root(self) -> Path:
@@ -56,7 +57,11 @@ class DynamoDocManager(IDocsManager):
         file_node = self._manager.get(node)
         if file_node is None:
             return None
-        return CustomNodeDocFile(file_node, self)
+        doc_file = self._doc_files.get(id(file_node))
+        if doc_file is None:
+            doc_file = CustomNodeDocFile(file_node, self)
+            self._doc_files[id(file_node)] = doc_file
+        return doc_file
 
 
 def create_docs(manager: IDynamoManager, doc_root: Path = DOC_ROOT, exporter: IExporter = get_org_exporter()) -> IDocsManager:
@@ -1,6 +1,7 @@
+import sys
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Iterable, List, Optional
+from typing import Any, Iterable, List, Optional, Tuple
 
 from dynamo.docs.models.content import AHeadlineDoc, TFile
 from dynamo.docs.docs import IExporter, IModelDocs
@@ -27,6 +28,10 @@ class DocSection:
     parse_value: str = field(compare=False)
     doc_type: DocType = field(compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'title', sys.intern(self.title))
+        object.__setattr__(self, 'parse_value', sys.intern(self.parse_value))
+
     def is_section(self, value: str) -> bool:
         return value.startswith(self.parse_value) and value.endswith(self.parse_value)
 
@@ -42,18 +47,30 @@ FILES = DocSection(title='Dateien', doc_type=DocType.HEADING, parse_value='')
 SOLUTION = DocSection(title='Problem / Lösung', doc_type=DocType.HEADING, parse_value='??')
 KNOWN_WARNING = DocSection(title='Warnungen', doc_type=DocType.NODE, parse_value='!!')
 
+_SECTIONS: Tuple[DocSection, ...] = (
+    INFO, DOCS, INPUT, OUTPUT, FILES, SOLUTION, KNOWN_WARNING
+)
+
 
 def _doc_sections() -> Iterable[DocSection]:
-    return [inst for _, inst in globals().items() if isinstance(inst, DocSection)]
+    return _SECTIONS
+
 
+_SECTION_PREFIXES = {section.parse_value: section for section in _doc_sections()
+                     if len(section.parse_value) > 0}
 
-def _get_doc_heading(line: str) -> DocSection:
+_PREFIX_LENGTHS = tuple(sorted({len(prefix) for prefix in _SECTION_PREFIXES}, reverse=True))
+
+
+def _get_doc_heading(line: str) -> Optional[DocSection]:
     line = line.strip()
-    for section in _doc_sections():
-        if not section.is_section(line):
-            continue
-        return section
-    return DocSection.unknown()
+    if len(line) == 0:
+        return None
+    for length in _PREFIX_LENGTHS:
+        section = _SECTION_PREFIXES.get(line[:length])
+        if section is not None and section.is_section(line):
+            return section
+    return None
 
 
 class DocsParser:
@@ -70,7 +87,7 @@ class DocsParser:
     def _parse(self) -> None:
         for idx, line in enumerate(self._lines):
             section = _get_doc_heading(line)
-            if DocSection.is_unknown(section):
+            if section is None:
                 continue
             self._section = section
             self._start_idx = idx
@@ -89,12 +106,14 @@ class DocsParser:
         line = self._lines[self._start_idx]
         return line.replace(self._section.parse_value, '').strip()
 
-    def content(self, exporter: IExporter, **kwargs) -> List[str]:
+    def content(self, exporter: IExporter) -> List[str]:
         doc_lines = self._lines[self._start_idx+1:]
         return exporter.value_handler.strip_empty(doc_lines)
 
 
 class SectionDocs(AHeadlineDoc[TFile]):
+    __slots__ = ('_parser',)
+
     def __init__(self, file: IModelDocs[TFile], parser: DocsParser) -> None:
         super().__init__(file, parser.title())
         self._parser = parser
@@ -103,17 +122,18 @@ class SectionDocs(AHeadlineDoc[TFile]):
     def section(self) -> DocSection:
         return self._parser._section
 
-    def _heading_content(self, **kwargs) -> List[str]:
-        return self._parser.content(self.exporter, **kwargs)
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        return self._parser.content(self._exporter)
 
 
 class AnnotationDocs(SectionDocs[TFile]):
+    __slots__ = ('_closest',)
 
     def __init__(self, file: IModelDocs[TFile], parser: DocsParser) -> None:
         super().__init__(file, parser)
         self._closest: Optional[IModelWithId] = None
 
-    def linked_node(self, **_) -> IModelWithId:
+    def linked_node(self) -> IModelWithId:
         if self._closest is not None:
             return self._closest
         if self._parser.is_doc_type(DocType.HEADING):
@@ -133,8 +153,9 @@ class AnnotationDocs(SectionDocs[TFile]):
 
 
 class GroupsDocs(SectionDocs[TFile]):
+    __slots__ = ()
 
-    def linked_nodes(self, **_) -> List[IModelWithId]:
+    def linked_nodes(self) -> List[IModelWithId]:
         if not isinstance(self._parser.node, IGroup):
             raise RuntimeError(f'Expect "IGroup" but got {type(self._parser.node)}')
         return self._parser.node.nodes
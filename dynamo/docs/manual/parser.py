@@ -46,13 +46,11 @@ class DocsNodeRepository(Generic[TDynamoFile]):
         self._add_group_docs(factory)
         self._annotation_docs: List[AnnotationDocs[IDynamoFile]] = []
         self._add_annotation_docs(factory)
+        self._node_docs: Optional[Dict[str, AnnotationDocs[IDynamoFile]]] = None
 
     def _add_group_docs(self, factory: DocsNodeFactory) -> None:
         for content in factory.group_docs(self.file):
-            section = content.section
-            if section not in self._group_sections:
-                self._group_sections[section] = []
-            self._group_sections[section].append(content)
+            self._group_sections.setdefault(content.section, []).append(content)
 
     def _add_annotation_docs(self, factory: DocsNodeFactory) -> None:
         for content in factory.annotation_docs(self.file):
@@ -61,10 +59,13 @@ class DocsNodeRepository(Generic[TDynamoFile]):
     def section_doc(self, section: DocSection) -> List[SectionDocs[IDynamoFile]]:
         return self._group_sections.get(section, [])
 
+    def _get_node_docs(self) -> Dict[str, AnnotationDocs[IDynamoFile]]:
+        if self._node_docs is None:
+            self._node_docs = {}
+            for doc in self._annotation_docs:
+                node_doc = doc.linked_node()
+                self._node_docs.setdefault(node_doc.node_id, doc)
+        return self._node_docs
+
     def node_docs(self, model: IModelWithId) -> Optional[IDocContent[IDynamoFile]]:
-        for doc in self._annotation_docs:
-            node_doc = doc.linked_node()
-            if model.node_id != node_doc.node_id:
-                continue
-            return doc
-        return None
+        return self._get_node_docs().get(model.node_id)
@@ -1,6 +1,6 @@
 from abc import abstractmethod
-from ctypes import ArgumentError
-from typing import List, Protocol, Type, TypeVar, Any
+from typing import (Any, Dict, Iterable, Iterator, List, Optional, Protocol,
+                    Tuple, Type, TypeVar)
 
 from dynamo.docs.docs import IDocsManager, IExporter, IModelDocs
 from dynamo.models.model import IBaseModel, IFileModel
@@ -10,6 +10,7 @@ TFile = TypeVar('TFile', bound=IFileModel)
 
 
 class IDocContent(Protocol[TFile]):
+    __slots__ = ()
     file: IModelDocs[TFile]
 
     @property
@@ -24,116 +25,138 @@ class IDocContent(Protocol[TFile]):
     def model(self) -> TFile:
         ...
 
-    def content(self, level: int, **kwargs) -> List[str]:
+    def content(self, level: int, node: Optional[Any] = None) -> List[str]:
+        ...
+
+    def emit(self, lines: List[str], level: int, node: Optional[Any] = None) -> None:
         ...
 
 
 class ADocContent(IDocContent[TFile]):
+    __slots__ = ('file', '_manager', '_model', '_exporter', '_value_handler', '_empty_line')
+
     def __init__(self, file: IModelDocs[TFile]) -> None:
         self.file = file
+        self._manager = file.manager
+        self._model = file.model
+        self._exporter = self._manager.exporter
+        self._value_handler = self._exporter.value_handler
+        self._empty_line = self._exporter.empty_line_value
 
     @property
     def manager(self) -> IDocsManager:
-        return self.file.manager
+        return self._manager
 
     @property
     def exporter(self) -> IExporter:
-        return self.manager.exporter
+        return self._exporter
 
     @property
     def value_handler(self) -> IValueHandler:
-        return self.exporter.value_handler
+        return self._value_handler
 
     def _strip_empty(self, content: List[str]) -> List[str]:
-        return self.value_handler.strip_empty(content)
-
-    def _lstrip_empty(self, content: List[str]) -> List[str]:
-        return self.value_handler.strip_starting_empty(content)
-
-    def _rstrip_empty(self, content: List[str]) -> List[str]:
-        return self.value_handler.strip_ending_empty(content)
+        return self._value_handler.strip_empty(content)
 
     @property
     def model(self) -> TFile:
-        return self.file.model
+        return self._model
 
-    def content(self, level: int, **kwargs) -> List[str]:
+    def content(self, level: int, node: Optional[Any] = None) -> List[str]:
         lines = []
-        lines.extend(self.exporter.empty_line())
-        content = self._content(level, **kwargs)
+        self.emit(lines, level, node)
+        return lines
+
+    def emit(self, lines: List[str], level: int, node: Optional[Any] = None) -> None:
+        lines.append(self._empty_line)
+        content = self._content(level, node)
         lines.extend(self._strip_empty(content))
-        lines.extend(self.exporter.empty_line())
+        lines.append(self._empty_line)
         children = self._children_content(level + 1)
         lines.extend(self._strip_empty(children))
-        return lines
 
     @abstractmethod
-    def _content(self, level: int, **kwargs) -> List[str]:
+    def _content(self, level: int, node: Optional[Any]) -> List[str]:
         pass
 
-    def _get_doc_content(self, child: IDocContent[Any], level: int, **kwargs) -> List[str]:
-        content = child.content(level, **kwargs)
-        content = self._rstrip_empty(content)
-        return content
-
-    def _children_content(self, level: int, **kwargs) -> List[str]:
+    def _emit_doc_content(self, lines: List[str], child: IDocContent[Any],
+                          level: int, node: Optional[Any] = None) -> None:
+        start = len(lines)
+        child.emit(lines, level, node)
+        is_empty_line = self._value_handler.is_empty_line
+        while len(lines) > start and is_empty_line(lines[-1]):
+            lines.pop()
+
+    def _add_docs_content(self, lines: List[str], children: Iterable[IDocContent[Any]],
+                          level: int) -> None:
+        for child in children:
+            self._emit_doc_content(lines, child, level)
+
+    def _add_nodes_content(self, lines: List[str], child: IDocContent[Any],
+                           nodes: Iterable[Any], level: int) -> None:
+        for node in nodes:
+            self._emit_doc_content(lines, child, level, node)
+
+    def _children_content(self, level: int) -> List[str]:
         return []
 
 
 TNode = TypeVar('TNode', bound=IBaseModel)
 
+_NODE_TYPE_CHECKS: Dict[Tuple[type, type], bool] = {}
+
+
+def _is_node_type(node: Any, node_type: type) -> bool:
+    key = (node_type, type(node))
+    is_type = _NODE_TYPE_CHECKS.get(key)
+    if is_type is None:
+        is_type = isinstance(node, node_type)
+        _NODE_TYPE_CHECKS[key] = is_type
+    return is_type
+
 
 class AHeadlineContent(ADocContent[TFile]):
+    __slots__ = ('_existing_content',)
 
     def __init__(self, file: IModelDocs[TFile]) -> None:
         super().__init__(file)
         self._existing_content: List[str] = []
 
-    def _get_node(self, node_type: Type[TNode], **kwargs) -> TNode:
-        arg = 'node'
-        node = kwargs.get(arg, None)
+    def _get_node(self, node_type: Type[TNode], node: Optional[Any]) -> TNode:
         if node is None:
-            raise ArgumentError(f'Argument "{arg}" is None or does not exists')
-        if not isinstance(node, node_type):
-            raise ArgumentError(f'Except "{node_type}" but got {type(node)}')
-        return node
-
-    def _get_level(self, **kwargs) -> int:
-        arg = 'level'
-        node = kwargs.get(arg, 0)
-        if node < 1:
-            raise ArgumentError(f'Argument "{arg}" is None or does not exists')
+            raise ValueError('Argument "node" is None')
+        if not _is_node_type(node, node_type):
+            raise ValueError(f'Except "{node_type}" but got {type(node)}')
         return node
 
-    def _content(self, level: int, **kwargs) -> List[str]:
-        lines = []
-        heading = self._heading(level, **kwargs)
+    def _content(self, level: int, node: Optional[Any]) -> List[str]:
+        heading = self._heading(level, node)
         self._set_existing_content(heading)
         # lines.extend(self.exporter.remove_starting_and_ending_empty_lines(heading))
-        lines.extend(heading)
-        lines.extend(self.exporter.empty_line())
-        content = self._heading_content(level=level, **kwargs)
+        lines = list(heading)
+        lines.append(self._empty_line)
+        content = self._heading_content(level, node)
         lines.extend(content)
         # lines.extend(self.exporter.remove_starting_and_ending_empty_lines(content))
         return lines
 
     @abstractmethod
-    def _heading(self, level: int, **kwargs) -> List[str]:
+    def _heading(self, level: int, node: Optional[Any]) -> List[str]:
         pass
 
     @abstractmethod
-    def _heading_content(self, **kwargs) -> List[str]:
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
         pass
 
     def _heading_value(self, lines: List[str]) -> str:
-        heading = self.value_handler.strip_starting_empty(lines)
+        heading = self._value_handler.strip_starting_empty(lines)
         if len(heading) < 1:
             raise ValueError(f'No Heading in {lines}')
         return heading[0]
 
     def _clean_existing_content(self) -> List[str]:
         lines = self._strip_empty(self._existing_content[1:])
-        lines = self.value_handler.remove_default_doc_value(lines)
+        lines = self._value_handler.remove_default_doc_value(lines)
         return lines
 
     def _set_existing_content(self, heading_lines: List[str]) -> None:
@@ -146,10 +169,10 @@ class AHeadlineContent(ADocContent[TFile]):
             self._existing_content.append(line.rstrip())
 
     def _is_next_heading(self, line: str) -> bool:
-        return self.exporter.is_heading(line)
+        return self._exporter.is_heading(line)
 
     def _manual_docs(self) -> List[str]:
-        values = self.value_handler
+        values = self._value_handler
         existing = self._clean_existing_content()
         existing = self._strip_empty(existing)
         return values.get_or_default(
@@ -158,26 +181,28 @@ class AHeadlineContent(ADocContent[TFile]):
 
 
 class AHeadlineDoc(AHeadlineContent[TFile]):
+    __slots__ = ('headline',)
 
     def __init__(self, file: IModelDocs[TFile], headline: str) -> None:
         super().__init__(file)
         self.headline = headline
 
-    def _heading(self, level: int, **_) -> List[str]:
-        return self.exporter.heading(self.headline, level)
+    def _heading(self, level: int, node: Optional[Any]) -> List[str]:
+        return self._exporter.heading(self.headline, level)
 
     @abstractmethod
-    def _heading_content(self, **kwargs) -> List[str]:
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
         pass
 
 
 class TitleDocContent(ADocContent[TFile]):
+    __slots__ = ()
 
-    def _content(self, _: int) -> List[str]:
-        lines = []
-        lines.extend(self.exporter.doc_head())
-        lines.extend(self.exporter.empty_line())
-        lines.extend(self.exporter.title(self.file))
+    def _content(self, level: int, node: Optional[Any]) -> List[str]:
+        exporter = self._exporter
+        lines = exporter.doc_head()
+        lines.append(self._empty_line)
+        lines.extend(exporter.title(self.file))
         return lines
 
 
@@ -185,3 +210,8 @@ class TitleDocContent(ADocContent[TFile]):
 def title_docs(file: IModelDocs[TFile]) -> IDocContent[TFile]:
     return TitleDocContent(file)
 
+
+def docs_lines(contents: Iterable[IDocContent[TFile]], level: int = 1) -> Iterator[str]:
+    for doc_content in contents:
+        yield from doc_content.content(level)
+
@@ -1,254 +1,313 @@
-from typing import List, TypeVar
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from dynamo.docs.docs import IModelDocs
 from dynamo.docs.manual.parser import DocsNodeRepository
 from dynamo.docs.models.content import AHeadlineContent, AHeadlineDoc, IDocContent
 from dynamo.models.model import IBaseModel, IDynamoFile, INode
 from dynamo.models.nodes import (APathInputNode, CodeBlockNode, CustomNode,
-                                 ExternalDependency,
-                                 PackageDependency,
+                                 DirInputNode, ExternalDependency,
+                                 FileInputNode, PackageDependency,
                                  PythonCodeNode)
-from dynamo.utils import checks
 
 
 
 TDynamoFile = TypeVar('TDynamoFile', bound=IDynamoFile)
 
+INFORMATION_HEADINGS = ('Attribut', 'Wert')
+PACKAGE_NODE_HEADINGS = ('Name', 'UUID')
+
 
 class ANodeDocsContent(AHeadlineContent[TDynamoFile]):
+    __slots__ = ('file_docs',)
+    information_labels = ('Beschreibung', 'Gruppe', 'Aktiviert', 'Zeigt Geometrie')
 
     def __init__(self, file_docs: DocsNodeRepository[TDynamoFile]) -> None:
         super().__init__(file=file_docs.file)
         self.file_docs = file_docs
 
-    def _heading(self, level: int, **kwargs) -> List[str]:
-        node = self._get_node(IBaseModel, **kwargs)
-        return self.exporter.heading(node.name, level)
+    def _heading(self, level: int, node: Optional[Any]) -> List[str]:
+        base_node = self._get_node(IBaseModel, node)
+        return self._exporter.heading(base_node.name, level)
 
-    def _information_table(self, node: INode) -> List[str]:
-        values = self.value_handler
+    def _information_rows(self, node: INode) -> List[List[str]]:
+        values = self._value_handler
+        description, group, enabled, geometry = self.information_labels
         group_name = None if node.group is None else node.group.name
-        lines = [
-            [
-                'Beschreibung', *values.get_or_default(node.description,
-                                                       default='Keine Beschreibung')
-            ],
-            [
-                'Gruppe', *values.get_or_default(group_name, default='Keine Gruppe')
-            ],
-            [
-                'Aktiviert', *values.bool_as_str(not node.disabled)
-            ],
-            [
-                'Zeigt Geometrie', *values.bool_as_str(node.show_geometry)
-            ],
+        return [
+            [description, *values.get_or_default(node.description, default='Keine Beschreibung')],
+            [group, *values.get_or_default(group_name, default='Keine Gruppe')],
+            [enabled, *values.bool_as_str(not node.disabled)],
+            [geometry, *values.bool_as_str(node.show_geometry)],
+            *self._extra_rows(node),
         ]
-        if isinstance(node, PythonCodeNode):
-            lines.append(
-                [
-                    'Engine', *values.get_or_default(node.engine, 'Keine Python Engine')
-                ])
-        return self.exporter.as_table(["Attribut", "Wert"], lines)
-
-    def _heading_content(self, **kwargs) -> List[str]:
-        node = self._get_node(INode, **kwargs)
-        docs_lines = self._information_table(node)
-        node_docs = self.file_docs.node_docs(node)
+
+    def _extra_rows(self, node: INode) -> List[List[str]]:
+        return []
+
+    def _add_information_table(self, docs_lines: List[str], node: INode) -> None:
+        rows = self._information_rows(node)
+        self._exporter.add_table(docs_lines, INFORMATION_HEADINGS, rows)
+
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        doc_node = self._get_node(INode, node)
+        docs_lines = []
+        self._add_information_table(docs_lines, doc_node)
+        node_docs = self.file_docs.node_docs(doc_node)
         if node_docs is None:
             return docs_lines
-        level = self._get_level()
-        docs_lines.extend(self.exporter.empty_line())
-        docs_lines.extend(node_docs.content(level, **kwargs))
+        docs_lines.append(self._empty_line)
+        node_docs.emit(docs_lines, level, doc_node)
         return docs_lines
 
 
 
 class CodeBlockDoc(ANodeDocsContent[TDynamoFile]):
+    __slots__ = ()
 
-    def _heading_content(self, **kwargs) -> List[str]:
-        node = self._get_node(CodeBlockNode, **kwargs)
-        lines = self.exporter.as_code(node.code, 'DesignScript', indent=4)
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        code_block = self._get_node(CodeBlockNode, node)
+        lines = self._exporter.as_code(code_block.code, 'DesignScript', indent=4)
         return lines
 
 
 class CodeBlocksDocs(AHeadlineDoc[TDynamoFile]):
+    __slots__ = ('node_docs', '_code_blocks')
 
     def __init__(self, file: IModelDocs[TDynamoFile],
                  node_docs: IDocContent[TDynamoFile], headline: str) -> None:
         super().__init__(file=file, headline=headline)
         self.node_docs = node_docs
+        self._code_blocks: Optional[List[CodeBlockNode]] = None
+
+    def _get_code_blocks(self) -> List[CodeBlockNode]:
+        if self._code_blocks is None:
+            self._code_blocks = self.model.get_nodes(CodeBlockNode)
+        return self._code_blocks
 
-    def _heading_content(self, **_) -> List[str]:
-        values = self.value_handler
-        code_blocks = self.model.get_nodes(CodeBlockNode)
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        values = self._value_handler
+        code_blocks = self._get_code_blocks()
         return values.list_or_default(code_blocks, 'Keine Code Blocks')
 
-    def _children_content(self, level: int, **kwargs) -> List[str]:
-        code_blocks = self.model.get_nodes(CodeBlockNode)
-        lines = super()._children_content(level, **kwargs)
-        for code_block in code_blocks:
-            content = self._get_doc_content(self.node_docs, level, node=code_block, **kwargs)
-            lines.extend(content)
+    def _children_content(self, level: int) -> List[str]:
+        code_blocks = self._get_code_blocks()
+        lines = super()._children_content(level)
+        self._add_nodes_content(lines, self.node_docs, code_blocks, level)
         return lines
 
 
 class PythonNodeDoc(ANodeDocsContent[TDynamoFile]):
+    __slots__ = ()
+    engine_label = 'Engine'
 
-    def _heading_content(self, **kwargs) -> List[str]:
-        node = self._get_node(PythonCodeNode, **kwargs)
-        lines = self.exporter.as_code(node.code, 'python', indent=4)
+    def _extra_rows(self, node: INode) -> List[List[str]]:
+        python_node = self._get_node(PythonCodeNode, node)
+        engine = self._value_handler.get_or_default(python_node.engine, 'Keine Python Engine')
+        return [[self.engine_label, *engine]]
+
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        python_node = self._get_node(PythonCodeNode, node)
+        lines = self._exporter.as_code(python_node.code, 'python', indent=4)
         return lines
 
 
 class PythonNodesDocs(AHeadlineDoc[TDynamoFile]):
+    __slots__ = ('node_doc', '_python_nodes')
 
     def __init__(self, file: IModelDocs[TDynamoFile],
                  node_doc: IDocContent[TDynamoFile], headline: str) -> None:
         super().__init__(file=file, headline=headline)
         self.node_doc = node_doc
+        self._python_nodes: Optional[List[PythonCodeNode]] = None
+
+    def _get_python_nodes(self) -> List[PythonCodeNode]:
+        if self._python_nodes is None:
+            self._python_nodes = self.model.get_nodes(PythonCodeNode)
+        return self._python_nodes
 
-    def _heading_content(self, **_) -> List[str]:
-        python_codes = self.model.get_nodes(PythonCodeNode)
-        return self.value_handler.list_or_default(python_codes, 'Keine Python Nodes')
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        python_codes = self._get_python_nodes()
+        return self._value_handler.list_or_default(python_codes, 'Keine Python Nodes')
 
-    def _children_content(self, level: int, **kwargs) -> List[str]:
-        python_nodes = self.model.get_nodes(PythonCodeNode)
-        lines = super()._children_content(level, **kwargs)
-        for python_node in python_nodes:
-            content = self._get_doc_content(self.node_doc, level, node=python_node, **kwargs)
-            lines.extend(content)
+    def _children_content(self, level: int) -> List[str]:
+        python_nodes = self._get_python_nodes()
+        lines = super()._children_content(level)
+        self._add_nodes_content(lines, self.node_doc, python_nodes, level)
         return lines
 
 
 class SourceCodeDocs(AHeadlineDoc[TDynamoFile]):
+    __slots__ = ('children',)
 
     def __init__(self, file: IModelDocs[TDynamoFile],
                  children: List[IDocContent[TDynamoFile]], headline: str) -> None:
         super().__init__(file=file, headline=headline)
         self.children = children
 
-    def _heading_content(self, **_) -> List[str]:
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
         return []
 
-    def _children_content(self, level: int, **kwargs) -> List[str]:
-        lines = super()._children_content(level, **kwargs)
-        for child in self.children:
-            content = self._get_doc_content(child, level, **kwargs)
-            lines.extend(content)
+    def _children_content(self, level: int) -> List[str]:
+        lines = super()._children_content(level)
+        self._add_docs_content(lines, self.children, level)
         return lines
 
 
 class FileAndDirectoryDocs(ANodeDocsContent[TDynamoFile]):
+    __slots__ = ()
 
     def _clean_existing_content(self) -> List[str]:
         lines = super()._clean_existing_content()
-        table_ranges = self.exporter.table_ranges(lines)
+        table_ranges = self._exporter.table_ranges(lines)
         if len(table_ranges) == 0:
             return lines
         start, end = table_ranges[0]
-        for _ in range(start, end):
-            del lines[0]
+        del lines[start:end]
         return lines
 
-    def _heading_content(self, **kwargs) -> List[str]:
-        lines = super()._heading_content(**kwargs)
-        lines.extend(self.exporter.empty_line())
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        lines = super()._heading_content(level, node)
+        lines.append(self._empty_line)
         lines.extend(self._manual_docs())
         return lines
 
 class PackageDependencyDocs(ANodeDocsContent[TDynamoFile]):
+    __slots__ = ('_package_names',)
+
+    def __init__(self, file_docs: DocsNodeRepository[TDynamoFile]) -> None:
+        super().__init__(file_docs)
+        self._package_names: Dict[int, str] = {}
 
     def _package_name(self, node: CustomNode) -> str:
+        name = self._package_names.get(id(node))
+        if name is None:
+            name = self._get_package_name(node)
+            self._package_names[id(node)] = name
+        return name
+
+    def _get_package_name(self, node: CustomNode) -> str:
         doc_file = self.manager.doc_file_of(node)
         if doc_file is None:
             return node.name
-        return self.exporter.file_link(doc_file, self.file)
+        return self._exporter.file_link(doc_file, self.file)
 
-    def _heading(self, level: int, **kwargs) -> List[str]:
-        package = self._get_node(PackageDependency, **kwargs)
-        return self.exporter.heading(package.full_name, level)
+    def _heading(self, level: int, node: Optional[Any]) -> List[str]:
+        package = self._get_node(PackageDependency, node)
+        return self._exporter.heading(package.full_name, level)
 
-    def _heading_content(self, **kwargs) -> List[str]:
-        values = self.value_handler
-        package = self._get_node(PackageDependency, **kwargs)
-        if checks.is_blank(package.nodes):
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        values = self._value_handler
+        package = self._get_node(PackageDependency, node)
+        if not package.nodes:
             return values.get_or_default(package.nodes, 'Keine Nodes')
-        lines = [[self._package_name(node), node.uuid] for node in package.nodes]
-        return self.exporter.as_table(["Name", "UUID"], lines)
+        package_name = self._package_name
+        lines = [[package_name(node), node.uuid] for node in package.nodes]
+        return self._exporter.as_table(PACKAGE_NODE_HEADINGS, lines)
 
 
 class PackageDependenciesDocs(AHeadlineDoc[TDynamoFile]):
+    __slots__ = ('node_docs', '_packages')
 
     def __init__(self, file: IModelDocs[TDynamoFile],
                  node_docs: IDocContent[TDynamoFile],
                  headline: str) -> None:
         super().__init__(file=file, headline=headline)
         self.node_docs = node_docs
+        self._packages: Optional[List[PackageDependency]] = None
 
-    def _heading_content(self, **_) -> List[str]:
-        values = self.value_handler
-        packages = self.model.get_dependencies(PackageDependency)
+    def _get_packages(self) -> List[PackageDependency]:
+        if self._packages is None:
+            self._packages = self.model.get_dependencies(PackageDependency)
+        return self._packages
+
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        values = self._value_handler
+        packages = self._get_packages()
         return values.default_or_empty(packages, 'Keine Abhängigkeiten zu Packages')
 
-    def _children_content(self, level: int, **kwargs) -> List[str]:
-        packages = self.model.get_dependencies(PackageDependency)
-        lines = super()._children_content(level, **kwargs)
-        for package in packages:
-            content = self._get_doc_content(self.node_docs, level, node=package, **kwargs)
-            lines.extend(content)
+    def _children_content(self, level: int) -> List[str]:
+        packages = self._get_packages()
+        lines = super()._children_content(level)
+        self._add_nodes_content(lines, self.node_docs, packages, level)
         return lines
 
 
+def _node_name(node: INode) -> str:
+    return node.name
+
+
+def _path_name(node: APathInputNode) -> str:
+    return node.path.name
+
+
+_NAME_EXTRACTORS: Dict[type, Callable[[Any], str]] = {
+    FileInputNode: _path_name,
+    DirInputNode: _path_name,
+}
+
+
+def _name_extractor(node_type: type) -> Callable[[Any], str]:
+    extractor = _NAME_EXTRACTORS.get(node_type)
+    if extractor is None:
+        extractor = _path_name if issubclass(node_type, APathInputNode) else _node_name
+        _NAME_EXTRACTORS[node_type] = extractor
+    return extractor
+
+
 class ExternalDependencyDocs(ANodeDocsContent[TDynamoFile]):
+    __slots__ = ()
 
     def _dependency_name(self, node: INode) -> str:
-        if not isinstance(node, APathInputNode):
-            return node.name
-        return node.path.name
+        return _name_extractor(type(node))(node)
 
-    def _heading_content(self, **kwargs) -> List[str]:
-        values = self.value_handler
-        external = self._get_node(ExternalDependency, **kwargs)
-        if checks.is_blank(external.nodes):
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        values = self._value_handler
+        external = self._get_node(ExternalDependency, node)
+        if not external.nodes:
             return values.get_or_default(external.nodes, 'Keine Nodes')
-        lines = [self._dependency_name(node) for node in external.nodes]
-        return self.exporter.as_list(lines)
+        dependency_name = self._dependency_name
+        lines = [dependency_name(node) for node in external.nodes]
+        return self._exporter.as_list(lines)
 
 
 class ExternalDependenciesDocs(AHeadlineDoc[TDynamoFile]):
+    __slots__ = ('node_docs', '_externals')
 
     def __init__(self, file: IModelDocs[TDynamoFile],
                  node_docs: IDocContent[TDynamoFile], headline: str) -> None:
         super().__init__(file=file, headline=headline)
         self.node_docs = node_docs
+        self._externals: Optional[List[ExternalDependency]] = None
+
+    def _get_externals(self) -> List[ExternalDependency]:
+        if self._externals is None:
+            self._externals = self.model.get_dependencies(ExternalDependency)
+        return self._externals
 
-    def _heading_content(self, **_) -> List[str]:
-        values = self.value_handler
-        externals = self.model.get_dependencies(ExternalDependency)
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        values = self._value_handler
+        externals = self._get_externals()
         return values.get_or_default(externals, 'Keine Externen Abhängigkeiten')
 
-    def _children_content(self, level: int, **kwargs) -> List[str]:
-        externals = self.model.get_dependencies(ExternalDependency)
-        lines = super()._children_content(level, **kwargs)
-        for external in externals:
-            content = self._get_doc_content(self.node_docs, level, node=external, **kwargs)
-            lines.extend(content)
+    def _children_content(self, level: int) -> List[str]:
+        externals = self._get_externals()
+        lines = super()._children_content(level)
+        self._add_nodes_content(lines, self.node_docs, externals, level)
         return lines
 
 
 class DependenciesDocs(AHeadlineDoc[TDynamoFile]):
+    __slots__ = ('children',)
 
     def __init__(self, file: IModelDocs[TDynamoFile],
                  children: List[IDocContent[TDynamoFile]], headline: str) -> None:
         super().__init__(file=file, headline=headline)
         self.children = children
 
-    def _heading_content(self, **_) -> List[str]:
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
         return []
 
-    def _children_content(self, level: int, **kwargs) -> List[str]:
-        lines = super()._children_content(level, **kwargs)
-        for child in self.children:
-            content = self._get_doc_content(child, level, **kwargs)
-            lines.extend(content)
+    def _children_content(self, level: int) -> List[str]:
+        lines = super()._children_content(level)
+        self._add_docs_content(lines, self.children, level)
         return lines
@@ -1,4 +1,4 @@
-from typing import List, TypeVar
+from typing import Any, List, Optional, TypeVar
 
 from dynamo.docs.manual.models import DocSection
 from dynamo.docs.manual.parser import DocsNodeRepository
@@ -6,35 +6,36 @@ from dynamo.docs.models.content import AHeadlineContent, IDocContent
 from dynamo.models.files import CustomFileNode
 from dynamo.models.model import IDynamoFile
 from dynamo.models.nodes import (APathInputNode, DirInputNode, FileInputNode)
-from dynamo.utils import checks
 
 TDynamoFile = TypeVar('TDynamoFile', bound=IDynamoFile)
 
+INFORMATION_HEADINGS = ('Attribut', 'Wert')
+
 
 class ASectionDoc(AHeadlineContent[TDynamoFile]):
+    __slots__ = ('section', 'file_docs')
 
     def __init__(self, section: DocSection, file_docs: DocsNodeRepository[TDynamoFile]) -> None:
         super().__init__(file=file_docs.file)
         self.section = section
         self.file_docs = file_docs
 
-    def _heading(self, level: int, **_) -> List[str]:
-        return self.exporter.heading(self.section.title, level)
+    def _heading(self, level: int, node: Optional[Any]) -> List[str]:
+        return self._exporter.heading(self.section.title, level)
 
-    def _heading_content(self, **kwargs) -> List[str]:
-        level = self._get_level(**kwargs)
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
         section_docs = self.file_docs.section_doc(self.section)
-        if checks.is_blank(section_docs):
+        if not section_docs:
             return self._manual_docs()
         lines = []
         for section_doc in section_docs:
-            content = section_doc.content(level=level, **kwargs)
-            lines.extend(content)
+            section_doc.emit(lines, level, node)
         return lines
 
 
 
 class TutorialDocs(ASectionDoc[TDynamoFile]):
+    __slots__ = ('children',)
 
     def __init__(self, section: DocSection,
                  children: List[IDocContent[TDynamoFile]],
@@ -42,80 +43,77 @@ class TutorialDocs(ASectionDoc[TDynamoFile]):
         super().__init__(section, file_docs)
         self.children = children
 
-    def _children_content(self, level: int, **kwargs) -> List[str]:
-        lines = super()._children_content(level, **kwargs)
-        for child in self.children:
-            content = self._get_doc_content(child, level, **kwargs)
-            lines.extend(content)
+    def _children_content(self, level: int) -> List[str]:
+        lines = super()._children_content(level)
+        self._add_docs_content(lines, self.children, level)
         return lines
 
 
 class SolutionOrProblemDocs(ASectionDoc[TDynamoFile]):
+    __slots__ = ()
 
-    def _heading_content(self, **_) -> List[str]:
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
         return self._manual_docs()
 
-    def _children_content(self, level: int, **kwargs) -> List[str]:
-        lines = super()._children_content(level, **kwargs)
-        for child in self.file_docs.section_doc(self.section):
-            content = self._get_doc_content(child, level, **kwargs)
-            lines.extend(content)
+    def _children_content(self, level: int) -> List[str]:
+        lines = super()._children_content(level)
+        self._add_docs_content(lines, self.file_docs.section_doc(self.section), level)
         return lines
 
 
 class FileInformationDocs(ASectionDoc[TDynamoFile]):
+    __slots__ = ('children',)
+    information_labels = ('UUID', 'Version', 'Kategorie')
 
     def __init__(self, children: List[IDocContent[TDynamoFile]],
                  section: DocSection, file_docs: DocsNodeRepository[TDynamoFile]) -> None:
         super().__init__(section=section, file_docs=file_docs)
         self.children = children
 
-    def _heading_content(self, **_) -> List[str]:
-        lines = [
-            self.value_handler.list_or_default(['UUID', self.model.uuid]),
-            self.value_handler.list_or_default(['Version', self.model.info.version]),
-        ]
-        if isinstance(self.model, CustomFileNode):
-            lines.append(
-                self.value_handler.list_or_default(['Kategorie', self.model.category])
-            )
-        return self.exporter.as_table(["Attribut", "Wert"], lines)
-
-    def _children_content(self, level: int, **kwargs) -> List[str]:
-        lines = super()._children_content(level, **kwargs)
-        for child in self.children:
-            content = self._get_doc_content(child, level, **kwargs)
-            lines.extend(content)
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        model = self.model
+        uuid, version, category = self.information_labels
+        rows = [[uuid, model.uuid], [version, model.info.version]]
+        if isinstance(model, CustomFileNode):
+            rows.append([category, model.category])
+        list_or_default = self._value_handler.list_or_default
+        lines = [list_or_default(row) for row in rows]
+        return self._exporter.as_table(INFORMATION_HEADINGS, lines)
+
+    def _children_content(self, level: int) -> List[str]:
+        lines = super()._children_content(level)
+        self._add_docs_content(lines, self.children, level)
         return lines
 
 
 class FileDescriptionDocs(ASectionDoc[TDynamoFile]):
+    __slots__ = ()
 
-    def _heading_content(self, **_) -> List[str]:
-        return self.value_handler.get_or_default(self.model.description, 'Keine Beschreibung')
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        return self._value_handler.get_or_default(self.model.description, 'Keine Beschreibung')
 
 
 class FilesAndDirectoriesDocs(ASectionDoc[TDynamoFile]):
+    __slots__ = ('node_docs', '_nodes')
 
     def __init__(self, node_docs: IDocContent[TDynamoFile],
                  section: DocSection, file_docs: DocsNodeRepository[TDynamoFile]) -> None:
         super().__init__(section=section, file_docs=file_docs)
         self.node_docs = node_docs
+        self._nodes: Optional[List[APathInputNode]] = None
 
     def _path_nodes(self) -> List[APathInputNode]:
-        nodes = []
-        nodes.extend(self.model.get_nodes(FileInputNode))
-        nodes.extend(self.model.get_nodes(DirInputNode))
-        return nodes
+        if self._nodes is None:
+            nodes = self.model.get_nodes((FileInputNode, DirInputNode))
+            self._nodes = sorted(nodes, key=lambda node: isinstance(node, DirInputNode))
+        return self._nodes
 
-    def _heading_content(self, **_) -> List[str]:
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
         nodes = self._path_nodes()
-        return self.value_handler.default_or_empty(nodes, 'Keine Pfad-Nodes')
+        return self._value_handler.default_or_empty(nodes, 'Keine Pfad-Nodes')
 
-    def _children_content(self, level: int, **kwargs) -> List[str]:
-        lines = super()._children_content(level, **kwargs)
-        lines = []
-        for node in self._path_nodes():
-            content = self._get_doc_content(self.node_docs, level, node=node, **kwargs)
-            lines.extend(content)
+    def _children_content(self, level: int) -> List[str]:
+        path_nodes = self._path_nodes()
+        lines = super()._children_content(level)
+        self._add_nodes_content(lines, self.node_docs, path_nodes, level)
         return lines
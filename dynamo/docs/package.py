@@ -1,26 +1,35 @@
-from ctypes import ArgumentError
-from typing import List, Tuple
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 from dynamo.docs.models import content
 from dynamo.docs.models.content import AHeadlineDoc, IDocContent
 from dynamo.docs.doc_models import CustomNodeDocFile
 from dynamo.docs.docs import IDocsFile, IModelDocs
-from dynamo.models.files import Package
+from dynamo.models.files import CustomFileNode, Package
 
 
 class PackageContentDocs(AHeadlineDoc[Package]):
+    __slots__ = ()
 
-    def _heading_content(self, **_) -> List[str]:
-        return self.value_handler.get_or_default(self.model.info.contents, 'Keine Inhalt')
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        return self._value_handler.get_or_default(self.model.info.contents, 'Keine Inhalt')
 
 
 class PackageDescriptionDocs(AHeadlineDoc[Package]):
+    __slots__ = ()
 
-    def _heading_content(self, **_) -> List[str]:
-        return self.value_handler.get_or_default(self.model.description, 'Keine Beschreibung')
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        return self._value_handler.get_or_default(self.model.description, 'Keine Beschreibung')
 
 
 class PackageInformationDocs(AHeadlineDoc[Package]):
+    __slots__ = ('children',)
+    information_rows = (
+        ('Version', attrgetter('version')),
+        ('Engine', attrgetter('engine_version')),
+        ('Homepage', attrgetter('site_url')),
+        ('Repository', attrgetter('repository_url')),
+    )
 
     def __init__(self, file: IModelDocs[Package],
                  children: List[IDocContent[Package]],
@@ -28,68 +37,77 @@ class PackageInformationDocs(AHeadlineDoc[Package]):
         super().__init__(file, headline)
         self.children = children
 
-    def _heading_content(self, **_) -> List[str]:
-        lines = [
-            ['Version', *self.value_handler.get_or_default(self.model.info.version)],
-            ['Engine', *self.value_handler.get_or_default(self.model.info.engine_version)],
-            ['Homepage', *self.value_handler.get_or_default(self.model.info.site_url)],
-            ['Repository', *self.value_handler.get_or_default(self.model.info.repository_url)]
-        ]
-        return self.exporter.as_table(None, lines)
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        info = self.model.info
+        get_or_default = self._value_handler.get_or_default
+        lines = [[label, *get_or_default(value_of(info))] for label, value_of in self.information_rows]
+        return self._exporter.as_table(None, lines)
 
-    def _children_content(self, level: int, **kwargs) -> List[str]:
-        lines = super()._children_content(level, **kwargs)
-        for child in self.children:
-            content = self._get_doc_content(child, level, **kwargs)
-            lines.extend(content)
+    def _children_content(self, level: int) -> List[str]:
+        lines = super()._children_content(level)
+        self._add_docs_content(lines, self.children, level)
         return lines
 
 
 class PackageCustomNodeDocs(AHeadlineDoc[Package]):
+    __slots__ = ('_category_nodes',)
 
-    def _get_category(self, **kwargs) -> str:
-        arg = 'category'
-        category = kwargs.get(arg, None)
+    def __init__(self, file: IModelDocs[Package], headline: str) -> None:
+        super().__init__(file, headline)
+        self._category_nodes: Optional[Dict[str, List[CustomFileNode]]] = None
+
+    def _get_category_nodes(self) -> Dict[str, List[CustomFileNode]]:
+        if self._category_nodes is None:
+            self._category_nodes = {}
+            for node in self.model.nodes:
+                self._category_nodes.setdefault(node.category, []).append(node)
+            for nodes in self._category_nodes.values():
+                nodes.sort(key=attrgetter('name'))
+        return self._category_nodes
+
+    def _get_category(self, category: Optional[Any]) -> str:
         if category is None:
-            raise ArgumentError(f'Argument "{arg}" is None or does not exists')
+            raise ValueError('Argument "category" is None')
         return category
 
-    def _heading(self, level: int, **kwargs) -> List[str]:
-        category = self._get_category(**kwargs)
-        return self.exporter.heading(category, level)
+    def _heading(self, level: int, node: Optional[Any]) -> List[str]:
+        category = self._get_category(node)
+        return self._exporter.heading(category, level)
 
-    def _heading_content(self, **kwargs) -> List[str]:
-        category = self._get_category(**kwargs)
-        nodes = self.model.by_category(category)
-        nodes = sorted(nodes, key=lambda node: node.name)
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
+        category = self._get_category(node)
+        nodes = self._get_category_nodes().get(category, [])
+        manager, file = self._manager, self.file
         paths: List[Tuple[IDocsFile, IDocsFile]] = [
-            (CustomNodeDocFile(node, self.manager), self.file) for node in nodes
+            (CustomNodeDocFile(node, manager), file) for node in nodes
         ]
-        lines = self.exporter.as_file_link_list(paths)
+        lines = self._exporter.as_file_link_list(paths)
         return lines
 
 
 class PackageNodesDocs(AHeadlineDoc[Package]):
+    __slots__ = ('docs', '_cats')
 
     def __init__(self, file: IModelDocs[Package],
                  docs: IDocContent[Package],
                  headline: str) -> None:
         super().__init__(file, headline)
         self.docs = docs
+        self._cats: Optional[List[str]] = None
 
     def _categories(self) -> List[str]:
-        cats = set([node.category for node in self.model.nodes])
-        return sorted(cats)
+        if self._cats is None:
+            self._cats = sorted({node.category for node in self.model.nodes})
+        return self._cats
 
-    def _heading_content(self, **_) -> List[str]:
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
         nodes = self._categories()
-        return self.value_handler.default_or_empty(nodes, 'Keine Kategorien')
+        return self._value_handler.default_or_empty(nodes, 'Keine Kategorien')
 
-    def _children_content(self, level: int, **kwargs) -> List[str]:
-        lines = super()._children_content(level, **kwargs)
-        for cat in self._categories():
-            content = self._get_doc_content(self.docs, level, category=cat, **kwargs)
-            lines.extend(content)
+    def _children_content(self, level: int) -> List[str]:
+        cats = self._categories()
+        lines = super()._children_content(level)
+        self._add_nodes_content(lines, self.docs, cats, level)
         return lines
 
 
@@ -115,7 +133,4 @@ def packages_content(file: IModelDocs[Package]) -> List[IDocContent[Package]]:
 
 
 def get_docs(file: IModelDocs[Package]):
-    docs = []
-    for package in packages_content(file):
-        docs.extend(package.content(1))
-    file.write(docs)
+    file.write(content.docs_lines(packages_content(file)))
@@ -1,6 +1,8 @@
+import os
 from abc import abstractmethod
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional, Sized
+from typing import Any, Dict, List, Optional, Sized, Tuple
 
 from dynamo.docs.models import content
 from dynamo.docs import custom
@@ -16,36 +18,55 @@ from dynamo.models.files import Script
 from dynamo.utils import paths
 
 
+_NUMBERED_FILES: Dict[Tuple[Path, str], Tuple[List[Path], Dict[Path, int]]] = {}
+
+
+def _numbered_files(parent: Path, suffix: str) -> Tuple[List[Path], Dict[Path, int]]:
+    key = (parent, suffix)
+    numbered = _NUMBERED_FILES.get(key)
+    if numbered is None:
+        numbers = []
+        suffix_case = os.path.normcase(suffix)
+        with os.scandir(parent) as entries:
+            for entry in entries:
+                if not os.path.normcase(entry.name).endswith(suffix_case):
+                    continue
+                if paths.is_dev_name(entry.name):
+                    continue
+                path = Path(entry.path)
+                number = paths.start_number_or_none_of(path)
+                if number is None:
+                    continue
+                numbers.append((number, path))
+        files = [path for _, path in sorted(numbers, key=itemgetter(0))]
+        numbered = (files, {path: idx for idx, path in enumerate(files)})
+        _NUMBERED_FILES[key] = numbered
+    return numbered
+
+
 class ScriptInputOutputContent(ASectionDoc[Script]):
+    __slots__ = ()
 
-    def _files_start_with_number(self, src_file: Path) -> List[Path]:
-        files = []
-        for path in src_file.parent.glob(f'*{src_file.suffix}'):
-            if paths.is_dev(path):
-                continue
-            number = paths.start_number_or_none_of(path)
-            if number is None:
-                continue
-            files.append(path)
-        return sorted(files, key=lambda path: paths.start_number_of(path))
+    def _files_start_with_number(self, src_file: Path) -> Tuple[List[Path], Dict[Path, int]]:
+        return _numbered_files(src_file.parent, src_file.suffix)
 
     def _clean_existing_content(self) -> List[str]:
         lines = super()._clean_existing_content()
-        indexes = self.exporter.link_indexes(lines)
+        indexes = self._exporter.link_indexes(lines)
         if len(indexes) == 0:
             return lines
         index, link, _ = indexes[0]
         if link.endswith(self.file.doc_path.suffix):
             del lines[index]
-        lines = self.exporter.value_handler.strip_starting_empty(lines)
+        lines = self._value_handler.strip_starting_empty(lines)
         return lines
 
-    def _heading_content(self, **kwargs) -> List[str]:
+    def _heading_content(self, level: int, node: Optional[Any]) -> List[str]:
         lines = []
         link_to_other = self._link_to_other()
         if link_to_other is not None:
             lines.append(link_to_other)
-            lines.extend(self.exporter.empty_line())
+            lines.append(self._empty_line)
         lines.extend(self._manual_docs())
         return lines
 
@@ -53,13 +74,15 @@ class ScriptInputOutputContent(ASectionDoc[Script]):
         number = paths.start_number_or_none_of(self.file.src_path)
         if number is None:
             return None
-        files = self._files_start_with_number(self.file.src_path)
-        script_idx = files.index(self.file.src_path)
+        files, indexes = self._files_start_with_number(self.file.src_path)
+        script_idx = indexes.get(self.file.src_path)
+        if script_idx is None:
+            raise ValueError(f'{self.file.src_path} is not in {files}')
         if not self._can_continue(files, script_idx):
             return None
         other_path = files[self._get_index(script_idx)]
         next_doc = ScriptPathDocFile(other_path, self.manager)
-        return self.exporter.file_link(next_doc, self.file)
+        return self._exporter.file_link(next_doc, self.file)
 
     @abstractmethod
     def _can_continue(self, _: Sized, index: int) -> bool:
@@ -71,6 +94,7 @@ class ScriptInputOutputContent(ASectionDoc[Script]):
 
 
 class ScriptInputDocs(ScriptInputOutputContent):
+    __slots__ = ()
 
     def _can_continue(self, _: Sized, index: int) -> bool:
         return index > 0
@@ -80,6 +104,7 @@ class ScriptInputDocs(ScriptInputOutputContent):
 
 
 class ScriptOutputDocs(ScriptInputOutputContent):
+    __slots__ = ()
 
     def _can_continue(self, others: Sized, index: int) -> bool:
         return index < len(others) - 1
@@ -116,7 +141,4 @@ def _scripts_content(file_docs: DocsNodeRepository[Script]) -> List[IDocContent[
 
 def get_docs(file: IModelDocs[Script]):
     file_docs = DocsNodeRepository(file, factory=DocsNodeFactory())
-    docs = []
-    for doc_content in _scripts_content(file_docs):
-        docs.extend(doc_content.content(1))
-    file.write(docs)
+    file.write(content.docs_lines(_scripts_content(file_docs)))
@@ -1,15 +1,34 @@
 from pathlib import Path
-from typing import Dict, cast
+from typing import Any, Dict, Tuple, cast
 
 import pandas as pd
 
 EXCEL_EXTENSIONS = [".xlsx", ".xls"]
 
+CACHE_SIZE = 32
+
+_EXCEL_CACHE: Dict[Tuple[str, int, str], Dict[str, pd.DataFrame]] = {}
+
 
 def is_excel_extension(extension: str):
     return extension in EXCEL_EXTENSIONS
 
 
+def _cache_key(path: Path, options: Dict[str, Any]) -> Tuple[str, int, str]:
+    return str(path.absolute()), path.stat().st_mtime_ns, repr(sorted(options.items()))
+
+
+def _read(path: Path, options: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+    import_data = pd.read_excel(path.absolute(), **options)
+
+    excel_data = {}
+    for sheet, data in import_data.items():
+        data = data.rename(str, axis='columns')
+        data = data.rename(str.strip, axis='columns')
+        excel_data[cast(str, sheet)] = data
+    return excel_data
+
+
 def read(path: Path, **kwargs) -> Dict[str, pd.DataFrame]:
     if not is_excel_extension(path.suffix):
         raise ValueError(f"{path.name} is a unknown Excel extension.")
@@ -19,11 +38,11 @@ def read(path: Path, **kwargs) -> Dict[str, pd.DataFrame]:
         "keep_default_na": False
     }
     options.update(kwargs)
-    import_data = pd.read_excel(path.absolute(), **options)
-
-    excel_data = {}
-    for sheet, data in import_data.items():
-        data = data.rename(str, axis='columns')
-        data = data.rename(str.strip, axis='columns')
-        excel_data[cast(str, sheet)] = data
-    return excel_data
+    key = _cache_key(path, options)
+    excel_data = _EXCEL_CACHE.get(key)
+    if excel_data is None:
+        excel_data = _read(path, options)
+        if len(_EXCEL_CACHE) >= CACHE_SIZE:
+            del _EXCEL_CACHE[next(iter(_EXCEL_CACHE))]
+        _EXCEL_CACHE[key] = excel_data
+    return {sheet: data.copy() for sheet, data in excel_data.items()}
@@ -1,8 +1,11 @@
-import codecs
+import csv
 import json
+import os
 from abc import ABC, abstractmethod
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Protocol, TextIO, TypeVar
+from typing import (Any, Callable, Dict, Iterable, List, Optional, Protocol,
+                    TextIO, Tuple, TypeVar)
 
 TUri = TypeVar("TUri", bound=Path, contravariant=True)
 TContent = TypeVar("TContent", bound=Iterable)
@@ -22,6 +25,8 @@ class IoHandler(Protocol[TUri, TContent]):
 
 
 class FileHandler(ABC, IoHandler[Path, TContent]):
+    read_newline: Optional[str] = None
+
     def __init__(self, extension: str, encoding: str = "utf-8") -> None:
         super().__init__()
         self.encoding = encoding
@@ -32,10 +37,10 @@ class FileHandler(ABC, IoHandler[Path, TContent]):
         return str(value.absolute())
 
     def can_read(self, path: Path, **kwargs) -> bool:
-        return path.exists()
+        return os.path.exists(path)
 
     def _open(self, path: Path, callback: Callable[[TextIO], Any], **kwargs) -> Any:
-        args = {"mode": "r", "encoding": self.encoding}
+        args = {"mode": "r", "encoding": self.encoding, "newline": self.read_newline}
         args.update(kwargs)
         with open(self._as_str(path), **args) as file:
             return callback(file, **kwargs)
@@ -50,9 +55,9 @@ class FileHandler(ABC, IoHandler[Path, TContent]):
         return self._open(path, self._read, **kwargs)
 
     def write(self, path: Path, content: TContent, **kwargs) -> None:
-        args = {"mode": "w", "encoding": self.encoding}
+        args = {"mode": "w", "encoding": self.encoding, "newline": ""}
         args.update(kwargs)
-        with codecs.open(self._as_str(path), **args) as file:
+        with open(self._as_str(path), **args) as file:
             self._write(file, content, **kwargs)
 
     @abstractmethod
@@ -69,8 +74,7 @@ class TextHandler(FileHandler[Iterable[str]]):
         return file.readlines()
 
     def _write(self, file: TextIO, content: Iterable[str], **kwargs) -> None:
-        content = [line if line.endswith("\n") else f"{line}\n" for line in content]
-        file.writelines(content)
+        file.writelines(line if line.endswith("\n") else f"{line}\n" for line in content)
 
 
 class OrgHandler(TextHandler):
@@ -79,6 +83,8 @@ class OrgHandler(TextHandler):
 
 
 class CsvHandler(FileHandler[List[List[Any]]]):
+    read_newline = ""
+
     def __init__(
         self, delimiter: str, extension: str = ".csv", encoding: str = "utf-8"
     ) -> None:
@@ -86,26 +92,22 @@ class CsvHandler(FileHandler[List[List[Any]]]):
         self.delimiter = delimiter
 
     def _read(self, file: TextIO, **kwargs) -> List[List[Any]]:
-        return [line.split(self.delimiter) for line in file.readlines()]
+        return list(csv.reader(file, delimiter=self.delimiter))
 
     def _to_dict(
-        self, headers: Iterable[str], values: List[Any], **kwargs
+        self, headers: Tuple[str, ...], values: List[Any], default: Any
     ) -> Dict[str, Any]:
-        value_dict = {}
-        for index, header in enumerate(headers):
-            value = (
-                values[index] if index < len(values) else kwargs.get("default", None)
-            )
-            value_dict[header] = value
-        return value_dict
+        missing = len(headers) - len(values)
+        if missing > 0:
+            values = [*values, *repeat(default, missing)]
+        return dict(zip(headers, values))
 
     def _as_dict(
         self, headers: Iterable[str], lines: Iterable[List[Any]], **kwargs
     ) -> List[Dict[str, Any]]:
-        values = []
-        for line in lines:
-            values.append(self._to_dict(headers, line, **kwargs))
-        return values
+        headers = tuple(headers)
+        default = kwargs.get("default", None)
+        return [self._to_dict(headers, line, default) for line in lines]
 
     def read_as_dict(self, path: Path, **kwargs) -> List[Dict[str, Any]]:
         hdr_idx = kwargs.get("header_idx", 0)
@@ -129,7 +131,7 @@ class JsonHandler(FileHandler[Dict[str, Any]]):
         return self._read_first_line(path, **kwargs).startswith("{")
 
     def _read(self, file: TextIO, **kwargs) -> Dict[str, Any]:
-        return json.loads(file.read())
+        return json.load(file)
 
     def _write(self, file: TextIO, content: Dict[str, Any], **kwargs) -> None:
         args = {"indent": 4, "ensure_ascii": False}
@@ -1,7 +1,8 @@
 import logging
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Iterable, List, Optional, Type
+from typing import Any, Dict, Iterable, List, Tuple, Type
 
 from dynamo.models.nodes import CustomNode, PackageDependency
 
@@ -29,17 +30,15 @@ class DynamoInfo(IInfoModel):
     run_type: str = field(compare=False, repr=False)
 
 
-def _node_by_id(node_id: str, nodes: Iterable[TNode]) -> Optional[TNode]:
+def _nodes_by_id(nodes: Iterable[TNode]) -> Dict[str, TNode]:
+    nodes_by_id = {}
     for node in nodes:
-        if node.node_id != node_id:
-            continue
-        return node
-    return None
+        nodes_by_id.setdefault(node.node_id, node)
+    return nodes_by_id
 
 
-def _nodes_by_ids(node_ids: Iterable[str], nodes: Iterable[TNode]) -> List[TNode]:
-    nodes_with_ids = [_node_by_id(node_id, nodes) for node_id in node_ids]
-    return [node for node in nodes_with_ids if node is not None]
+def _nodes_by_ids(node_ids: Iterable[str], nodes_by_id: Dict[str, TNode]) -> List[TNode]:
+    return [nodes_by_id[node_id] for node_id in node_ids if node_id in nodes_by_id]
 
 
 @dataclass
@@ -51,6 +50,10 @@ class ADynamoFileNode(AFileBaseModel, IDynamoFile[DynamoInfo]):
     groups: List[IGroup] = field(compare=False, repr=False)
     dependencies: List[IDependency] = field(compare=False, repr=False)
     annotations: List[IAnnotation] = field(compare=False, repr=False)
+    _nodes_by_type: Dict[Any, List[INode]] = field(
+        default_factory=dict, init=False, compare=False, repr=False)
+    _dependencies_by_type: Dict[Any, List[IDependency]] = field(
+        default_factory=dict, init=False, compare=False, repr=False)
 
     @property
     def full_name(self) -> str:
@@ -60,17 +63,22 @@ class ADynamoFileNode(AFileBaseModel, IDynamoFile[DynamoInfo]):
     def version(self) -> str:
         return self.info.version
 
-    def _update_group_in_nodes(self, node_ids: Iterable[str]) -> List[IModelWithId]:
-        nodes: List[IModelWithId] = _nodes_by_ids(node_ids, self.nodes)
-        nodes.extend(_nodes_by_ids(node_ids, self.annotations))
+    def _update_group_in_nodes(self, node_ids: Iterable[str], nodes_by_id: Dict[str, INode],
+                               annotations_by_id: Dict[str, IAnnotation]) -> List[IModelWithId]:
+        nodes: List[IModelWithId] = _nodes_by_ids(node_ids, nodes_by_id)
+        nodes.extend(_nodes_by_ids(node_ids, annotations_by_id))
         return nodes
 
     def _update_groups(self) -> None:
+        update_group = partial(self._update_group_in_nodes,
+                               nodes_by_id=_nodes_by_id(self.nodes),
+                               annotations_by_id=_nodes_by_id(self.annotations))
         for group in self.groups:
-            group.add_nodes(self._update_group_in_nodes)
+            group.add_nodes(update_group)
 
     def _update_package_in_nodes(self, node_ids: Iterable[str]) -> List[CustomNode]:
         nodes = self.get_nodes(CustomNode)
+        node_ids = set(node_ids)
         return [node for node in nodes if node.node_id in node_ids]
 
     def _update_packages(self) -> None:
@@ -78,22 +86,32 @@ class ADynamoFileNode(AFileBaseModel, IDynamoFile[DynamoInfo]):
             dependency.add_nodes(self._update_package_in_nodes)
 
     def update_nodes(self) -> None:
+        self._nodes_by_type.clear()
+        self._dependencies_by_type.clear()
         self._update_groups()
         self._update_packages()
 
     def has_dependencies(self, node_type: Type[TDependency]) -> bool:
-        return len(self.get_dependencies(node_type)) > 0
+        return any(isinstance(node, node_type) for node in self.dependencies)
 
     def get_dependencies(self, node_type: Type[TDependency]) -> List[TDependency]:
-        nodes = [node for node in self.dependencies if isinstance(node, node_type)]
-        return sorted(nodes, key=lambda dep: dep.name)
+        dependencies = self._dependencies_by_type.get(node_type)
+        if dependencies is None:
+            nodes = [node for node in self.dependencies if isinstance(node, node_type)]
+            dependencies = sorted(nodes, key=lambda dep: dep.name)
+            self._dependencies_by_type[node_type] = dependencies
+        return dependencies
 
     def has_nodes(self, node_type: Type[TNode]) -> bool:
-        return len(self.get_nodes(node_type)) > 0
-
-    def get_nodes(self, node_type: Type[TNode]) -> List[TNode]:
-        nodes = [node for node in self.nodes if isinstance(node, node_type)]
-        return sorted(nodes, key=lambda node: (node.name, node.node_id))
+        return any(isinstance(node, node_type) for node in self.nodes)
+
+    def get_nodes(self, node_type: Type[TNode] | Tuple[Type[TNode], ...]) -> List[TNode]:
+        nodes = self._nodes_by_type.get(node_type)
+        if nodes is None:
+            nodes = [node for node in self.nodes if isinstance(node, node_type)]
+            nodes = sorted(nodes, key=lambda node: (node.name, node.node_id))
+            self._nodes_by_type[node_type] = nodes
+        return nodes
 
 
 @ dataclass
@@ -1,15 +1,17 @@
 
 from pathlib import Path
-from typing import (Any, Callable, Iterable, List, Optional, Protocol, Type,
-                    TypeVar, runtime_checkable)
+from typing import (Any, Callable, Iterable, List, Optional, Protocol, Tuple,
+                    Type, TypeVar, runtime_checkable)
 
 
 @runtime_checkable
 class IBaseModel(Protocol):
+    __slots__ = ()
     name: str
 
 
 class IModelWithId(IBaseModel, Protocol):
+    __slots__ = ()
     node_id: str
     x: float
     y: float
@@ -20,6 +22,7 @@ TNode = TypeVar('TNode', bound=IModelWithId)
 
 
 class IModelWithNodes(Protocol[TNode]):
+    __slots__ = ()
     node_ids: List[str]
 
     @property
@@ -32,19 +35,23 @@ class IModelWithNodes(Protocol[TNode]):
 
 @runtime_checkable
 class IAnnotation(IModelWithId, Protocol):
+    __slots__ = ()
     description: str
 
 
 @runtime_checkable
 class IGroup(IAnnotation, IModelWithNodes[IModelWithId],  Protocol):
+    __slots__ = ()
     color: str
 
 
 class IDependency(IBaseModel, IModelWithNodes[TNode],  Protocol[TNode]):
+    __slots__ = ()
     nodes: List[IBaseModel]
 
 
 class IPackage(IBaseModel, Protocol):
+    __slots__ = ()
     version: str
 
     @ property
@@ -53,12 +60,14 @@ class IPackage(IBaseModel, Protocol):
 
 
 class INode(IModelWithId, Protocol):
+    __slots__ = ()
     description: str
     disabled: bool
     show_geometry: bool
 
 
 class ICustomNode(IBaseModel, Protocol):
+    __slots__ = ()
     uuid: str
     name: str
     package: IPackage
@@ -104,7 +113,7 @@ class IDynamoFile(IFileModel[INode, TInfo], Protocol[TInfo]):
     def has_nodes(self, node_type: Type[TNode]) -> bool:
         ...
 
-    def get_nodes(self, node_type: Type[TNode]) -> List[TNode]:
+    def get_nodes(self, node_type: Type[TNode] | Tuple[Type[TNode], ...]) -> List[TNode]:
         ...
 
 
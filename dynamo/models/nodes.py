@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Iterable, List, Optional
+from typing import Callable, Iterable, List, Optional, Tuple
 
 from dynamo.models import model
 from dynamo.models.model import (IAnnotation, IBaseModel, ICustomNode,
@@ -8,19 +8,19 @@ from dynamo.models.model import (IAnnotation, IBaseModel, ICustomNode,
                                  IPackage)
 
 
-@dataclass
+@dataclass(slots=True)
 class ABaseModel(IBaseModel):
     name: str = field(repr=True, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ABaseNode(ABaseModel):
     node_id: str = field(repr=False, compare=True)
     x: float = field(compare=False, repr=False)
     y: float = field(compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Annotation(IAnnotation):
     node_id: str = field(repr=False, compare=True)
     x: float = field(compare=False, repr=False)
@@ -30,7 +30,7 @@ class Annotation(IAnnotation):
     name: str = field(default='Annotation', repr=True, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Group(ABaseNode, IGroup):
     color: str = field(compare=False, repr=False)
     description: str = field(compare=False, repr=False)
@@ -43,63 +43,66 @@ class Group(ABaseNode, IGroup):
         return self._nodes
 
     def add_nodes(self, callback: Callable[[Iterable[str]], List[ABaseNode]]) -> None:
-        self._nodes.clear()
-        self._nodes.extend(callback(self.node_ids))
+        nodes = callback(self.node_ids)
+        self._nodes = nodes if isinstance(nodes, list) else list(nodes)
         model.add_to_nodes(self, self._nodes, ['group'])
 
 
-@dataclass
+@dataclass(slots=True)
 class ElementResolving(ABaseModel, IBaseModel):
     namespace: str = field(compare=False, repr=False)
     library: str = field(compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class AInputOutputNode(ABaseModel, IBaseModel):
     description: str = field(compare=False, repr=False)
     initial_values: str = field(compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamoNode(ABaseNode):
     description: str = field(repr=False, compare=False)
     disabled: bool = field(repr=False, compare=False)
     show_geometry: bool = field(repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneralNode(DynamoNode):
     group: Optional[IGroup] = field(default=None, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class APathInputNode(DynamoNode, INode):
     hint_path: str = field(repr=False, compare=False)
     input_value: str = field(repr=False, compare=False)
     group: Optional[IGroup] = field(default=None, compare=False, repr=False)
+    _path: Optional[Tuple[str, Path]] = field(default=None, init=False, compare=False, repr=False)
 
     @property
     def path(self) -> Path:
-        return Path(self.hint_path)
+        if self._path is None or self._path[0] != self.hint_path:
+            self._path = (self.hint_path, Path(self.hint_path))
+        return self._path[1]
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInputNode(APathInputNode):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class DirInputNode(APathInputNode):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeBlockNode(INode, DynamoNode):
     code: str = field(repr=False, compare=False)
     group: Optional[IGroup] = field(default=None, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class PythonCodeNode(INode, DynamoNode):
     code: str = field(repr=False, compare=False)
     engine: str = field(repr=False, compare=False)
@@ -110,24 +113,24 @@ def default_package() -> IPackage:
     return PackageDependency(name='', version='', node_ids=[])
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomNode(ICustomNode, INode, DynamoNode):
     uuid: str = field(compare=False, repr=True)
     package: IPackage = field(default_factory=default_package, compare=False, repr=True)
     group: Optional[IGroup] = field(default=None, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomPythonNode(CustomNode):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomNetNode(CustomNode):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class PackageDependency(IPackage, ABaseModel, IDependency[CustomNode]):
     version: str = field(repr=True, compare=False)
     node_ids: List[str] = field(default_factory=list, compare=False, repr=False)
@@ -142,12 +145,12 @@ class PackageDependency(IPackage, ABaseModel, IDependency[CustomNode]):
         return self._nodes
 
     def add_nodes(self, callback: Callable[[Iterable[str]], List[CustomNode]]) -> None:
-        self._nodes.clear()
-        self._nodes.extend(callback(self.node_ids))
+        nodes = callback(self.node_ids)
+        self._nodes = nodes if isinstance(nodes, list) else list(nodes)
         model.add_to_nodes(self, self._nodes, ['package'])
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalDependency(ABaseModel, IDependency[IModelWithId]):
     node_ids: List[str] = field(default_factory=list, compare=False, repr=False)
     _nodes: List[INode] = field(default_factory=list, compare=False, repr=False)
@@ -157,6 +160,6 @@ class ExternalDependency(ABaseModel, IDependency[IModelWithId]):
         return self._nodes
 
     def add_nodes(self, callback: Callable[[Iterable[str]], List[INode]]) -> None:
-        self._nodes.clear()
-        self._nodes.extend(callback(self.node_ids))
+        nodes = callback(self.node_ids)
+        self._nodes = nodes if isinstance(nodes, list) else list(nodes)
         model.add_to_nodes(self, self._nodes, [])
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from dynamo.models.files import CustomFileNode, Package
 from dynamo.models.nodes import CustomNode, ICustomNode
@@ -27,10 +27,10 @@ class DynamoManager(IDynamoManager):
     def __init__(self, src_path: Path) -> None:
         super().__init__()
         self.src_path = src_path
-        self.uuid_dict: Dict[str, CustomFileNode] = {}
+        self.uuid_dict: Dict[Tuple[str, str], CustomFileNode] = {}
 
-    def _uuid_key(self, node: ICustomNode) -> str:
-        return f'{node.uuid}-{node.package.version}'
+    def _uuid_key(self, node: ICustomNode) -> Tuple[str, str]:
+        return node.uuid, node.package.version
 
     def add(self, package: Package):
         for node in package.nodes:
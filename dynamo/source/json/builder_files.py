@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterable, List, OrderedDict, Tuple, Type, TypeVar
+from typing import (Any, Dict, Iterable, List, Optional, OrderedDict, Tuple,
+                    Type, TypeVar)
 
 from dynamo.models.files import (ADynamoFileNode, AFileBaseModel,
                                  Package, PythonCustomFileNode, Script)
@@ -23,19 +24,35 @@ class AFileBuilder(ABC, IBuilder[TFileModel, ISourceRepository]):
         """Dict with node attr as key and content attr as value"""
         raise NotImplementedError
 
+    @classmethod
+    def builder_map(cls) -> OrderedDict[str, Tuple[str, IBuilder]]:
+        raise NotImplementedError
+
     def __init__(self, node_type: Type[TFileModel]) -> None:
         super().__init__()
         self.node_type = node_type
+        self._attr_map: Optional[Dict[str, Tuple[str, Any]]] = None
+        self._builders: Optional[OrderedDict[str, Tuple[str, IBuilder]]] = None
+
+    def _get_attr_map(self) -> Dict[str, Tuple[str, Any]]:
+        if self._attr_map is None:
+            self._attr_map = self.attr_src_map()
+        return self._attr_map
+
+    def _get_builders(self) -> OrderedDict[str, Tuple[str, IBuilder]]:
+        if self._builders is None:
+            self._builders = self.builder_map()
+        return self._builders
 
     def get_attributes(self, repo: ISourceRepository) -> Dict[str, Any]:
         attributes = {'path': repo.file_path}
-        for attr, src_attr in self.attr_src_map().items():
+        for attr, src_attr in self._get_attr_map().items():
             attributes[attr] = repo.content.get(*src_attr)
         attributes.update(self.get_builder_attributes(repo))
         return attributes
 
     def can_build(self, repo: ISourceRepository) -> bool:
-        return all(attr in repo.content for (attr, _) in self.attr_src_map().values())
+        return all(attr in repo.content for (attr, _) in self._get_attr_map().values())
 
     @abstractmethod
     def get_builder_attributes(self, repo: ISourceRepository) -> Dict[str, Any]:
@@ -90,7 +107,7 @@ class ADynamoFileBuilder(AFileBuilder[TDynamoFile]):
 
     def get_builder_attributes(self, repo: ISourceRepository) -> Dict[str, Any]:
         attr_values = {}
-        for attr, builder in self.builder_map().items():
+        for attr, builder in self._get_builders().items():
             models = self._build_nodes(repo, builder)
             if attr == 'info':
                 models = None if len(models) == 0 else models[0]
@@ -147,7 +164,7 @@ class PackageFileBuilder(AFileBuilder[Package]):
 
     def get_builder_attributes(self, repo: ISourceRepository) -> Dict[str, Any]:
         attr_values = {}
-        for attr, builder in self.builder_map().items():
+        for attr, builder in self._get_builders().items():
             model = self._build_nodes(repo, builder)
             attr_values[attr] = model
         return attr_values
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Iterable, Optional, Tuple, Type, TypeVar
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
 
 from dynamo.models.files import DynamoInfo, PackageInfo
 from dynamo.models.model import IDependency
@@ -167,13 +167,26 @@ def node_builders() -> Iterable[NodeBuilder]:
 
 
 class DynamoNodeBuilder(IBuilder[DynamoNode, Dict[str, Any]]):
+    type_key = 'ConcreteType'
 
     def __init__(self, builders: Optional[Iterable[NodeBuilder]] = None) -> None:
         super().__init__()
-        self.builders = builders or node_builders()
+        self.builders = list(builders or node_builders())
+        self._builders_by_type: Dict[str, List[NodeBuilder]] = {}
+
+    def _type_builders(self, content: Dict[str, Any]) -> List[NodeBuilder]:
+        node_type = content.get(self.type_key)
+        if not isinstance(node_type, str):
+            return self.builders
+        builders = self._builders_by_type.get(node_type)
+        if builders is None:
+            builders = [builder for builder in self.builders
+                        if builder.build_values.get(self.type_key, node_type) == node_type]
+            self._builders_by_type[node_type] = builders
+        return builders
 
     def _build_by(self, content: Dict[str, Any], **kwargs) -> Optional[NodeBuilder]:
-        for builder in self.builders:
+        for builder in self._type_builders(content):
             if not builder.can_build(content, **kwargs):
                 continue
             return builder
@@ -1,3 +1,4 @@
+from operator import attrgetter
 from pathlib import Path
 from typing import Iterable, List
 
@@ -47,10 +48,10 @@ class JsonDynamoGateway(INodeGateway):
                     print(f'PACKAGE not created "{path}"')
                     continue
                 package = self.factory.package(path)
-                packages[package.full_name] = package
+                packages[(package.name, package.version)] = package
             except UnicodeEncodeError as err:
                 print(f'Package: Encode Error {str(path.absolute())} [{str(err)}]')
-        return sorted(packages.values(), key=lambda pkg: pkg.full_name)
+        return sorted(packages.values(), key=attrgetter('full_name'))
 
     def packages(self, paths: Iterable[Path]) -> List[Package]:
         packages = []
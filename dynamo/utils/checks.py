@@ -1,4 +1,4 @@
-from typing import Any, Collection, List, Optional, TypeGuard, TypeVar, Union
+from typing import Any, Collection, Optional, TypeGuard, TypeVar
 
 TValue = TypeVar('TValue', bound=Any | Collection[Any])
 
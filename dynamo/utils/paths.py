@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 from typing import Iterable, List, Optional, Union
@@ -94,5 +95,15 @@ def start_number_of(path: Path, default: int = sys.maxsize) -> int:
 DEV_NAMES = ['_dev_', ' dev ', '-dev-']
 
 
+def _is_dev_stem(stem: str) -> bool:
+    stem = stem.lower()
+    return any(dev in stem for dev in DEV_NAMES)
+
+
 def is_dev(path: Path) -> bool:
-    return any(dev in path.stem.lower() for dev in DEV_NAMES)
+    return _is_dev_stem(path.stem)
+
+
+def is_dev_name(name: str) -> bool:
+    stem, _ = os.path.splitext(name)
+    return _is_dev_stem(stem)
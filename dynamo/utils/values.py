@@ -31,6 +31,9 @@ class IValueHandler(Protocol):
     def default_or_empty(self, values: Optional[List[Any]], default: Optional[str] = None) -> List[str]:
         ...
 
+    def is_empty_line(self, line: str) -> bool:
+        ...
+
     def strip_starting_empty(self, lines: List[str]) -> List[str]:
         ...
 
@@ -85,8 +88,9 @@ class ValueHandler(IValueHandler):
 
     def list_or_default(self, values: List[Any], default: Optional[str] = None) -> List[str]:
         val_or_default = []
+        get_or_default = self.get_or_default
         for value in values:
-            val_or_default.extend(self.get_or_default(value, default))
+            val_or_default.extend(get_or_default(value, default))
         return val_or_default
 
     def name_or_default(self, model: Optional[IBaseModel], default: Optional[str] = None) -> str:
@@ -99,22 +103,41 @@ class ValueHandler(IValueHandler):
             return [self._get_default(default)]
         return []
 
-    def _can_strip(self, values: List[Any], index: int) -> bool:
-        return checks.is_not_blank(values) and checks.is_blank(values[index], strip=True)
+    def is_empty_line(self, line: str) -> bool:
+        return checks.is_blank(line, strip=True)
+
+    def _start_index(self, lines: List[str]) -> int:
+        start = 0
+        while start < len(lines) and self.is_empty_line(lines[start]):
+            start += 1
+        return start
+
+    def _end_index(self, lines: List[str], start: int = 0) -> int:
+        end = len(lines)
+        while end > start and self.is_empty_line(lines[end - 1]):
+            end -= 1
+        return end
+
+    def _strip_lines(self, lines: List[str], start: int, end: int) -> List[str]:
+        if start == 0 and end == len(lines):
+            return lines
+        return lines[start:end]
 
     def strip_starting_empty(self, lines: List[str]) -> List[str]:
-        while self._can_strip(lines, index=0):
-            lines = lines[1:]
-        return lines
+        if checks.is_blank(lines):
+            return lines
+        return self._strip_lines(lines, self._start_index(lines), len(lines))
 
     def strip_ending_empty(self, lines: List[str]) -> List[str]:
-        while self._can_strip(lines, index=-1):
-            lines = lines[:-1]
-        return lines
+        if checks.is_blank(lines):
+            return lines
+        return self._strip_lines(lines, 0, self._end_index(lines))
 
     def strip_empty(self, lines: List[str]) -> List[str]:
-        lines = self.strip_starting_empty(lines)
-        return self.strip_ending_empty(lines)
+        if checks.is_blank(lines):
+            return lines
+        start = self._start_index(lines)
+        return self._strip_lines(lines, start, self._end_index(lines, start))
 
     def remove_default_doc_value(self, lines: List[str]) -> List[str]:
         while self.default_docs in lines:
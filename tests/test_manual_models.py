@@ -0,0 +1,29 @@
+import unittest
+
+from dynamo.docs.manual.models import (INPUT, KNOWN_WARNING, OUTPUT, SOLUTION,
+                                       _get_doc_heading)
+
+
+class GetDocHeadingTest(unittest.TestCase):
+
+    def test_marker_followed_by_space(self):
+        self.assertIs(_get_doc_heading('<< Eingabe <<'), INPUT)
+        self.assertIs(_get_doc_heading('>> Ausgabe >>'), OUTPUT)
+
+    def test_marker_without_space(self):
+        self.assertIs(_get_doc_heading('<<Eingabe<<'), INPUT)
+        self.assertIs(_get_doc_heading('??Lösung??'), SOLUTION)
+        self.assertIs(_get_doc_heading('!!Warnung!!'), KNOWN_WARNING)
+
+    def test_surrounding_whitespace(self):
+        self.assertIs(_get_doc_heading('  !!Warnung!!  '), KNOWN_WARNING)
+
+    def test_no_section(self):
+        self.assertIsNone(_get_doc_heading(''))
+        self.assertIsNone(_get_doc_heading('Eingabe'))
+        self.assertIsNone(_get_doc_heading('<<Eingabe'))
+        self.assertIsNone(_get_doc_heading('<<Eingabe>>'))
+
+
+if __name__ == '__main__':
+    unittest.main()